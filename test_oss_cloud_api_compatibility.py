@@ -1,39 +1,130 @@
+import functools
 import json
 import re
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Mapping, NamedTuple
 
 import pytest
 
-
-PREFECT_V2 = False
+# The schema files are multi-MB OpenAPI documents, so prefer a fast JSON parser
+# when one is installed.
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    try:
+        from ujson import loads as json_loads
+    except ImportError:
+        json_loads = json.loads
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def oss_schema():
-    schema = load_schema("oss_schema.json")
-    if schema["info"]["version"].startswith("2"):
-        global PREFECT_V2
-        PREFECT_V2 = True
-    return schema
+    return load_schema("oss_schema.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def cloud_schema():
     return load_schema("cloud_schema.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def cloud_paths():
     return load_schema("cloud_schema.json", key="paths")
 
 
-def load_schema(fpath: str, key: str = None):
-    with open(fpath, "r") as f:
-        schema = json.load(f)
+@pytest.fixture(scope="session")
+def cloud_components(cloud_schema):
+    return cloud_schema["components"]["schemas"]
+
+
+@pytest.fixture(scope="session")
+def body_prop_table(oss_schema, cloud_schema):
+    """Cloud and OSS request body properties keyed by OSS `(method, endpoint)`
+
+    Rows are `None` when both request bodies are identical, or summarize to the
+    same properties, since they need no further comparison. A body that could not
+    be summarized is stored as its exception, for its own case to raise.
+    """
+    # Most request bodies are shared between several paths (or absent), so only
+    # summarize each distinct body schema once
+    summaries = {}
+
+    def summarize(ref_schema, ignored_props=frozenset()):
+        key = (id(ref_schema), ignored_props)
+        if key not in summaries:
+            summaries[key] = body_properties(ref_schema, ignored_props)
+        return summaries[key]
+
+    comparisons = {}
+
+    def identical(cloud_ref_schema, oss_ref_schema):
+        key = (id(cloud_ref_schema), id(oss_ref_schema))
+        if key not in comparisons:
+            comparisons[key] = (
+                cloud_ref_schema == oss_ref_schema
+                # aliased properties are looked up under another name in Cloud, so
+                # they need the full comparison
+                and KNOWN_ALIASES.keys().isdisjoint(oss_ref_schema["properties"])
+            )
+        return comparisons[key]
+
+    def compare(case):
+        cloud_ref_schema = (
+            lookup_schema_ref(
+                schema=cloud_schema, ref=lookup_content_body_schema(case.cloud_body)
+            )
+            or EMPTY_BODY_SCHEMA
+        )
+        oss_ref_schema = (
+            lookup_schema_ref(
+                schema=oss_schema, ref=lookup_content_body_schema(case.body)
+            )
+            or EMPTY_BODY_SCHEMA
+        )
+
+        if identical(cloud_ref_schema, oss_ref_schema):
+            return None
+
+        cloud_props = summarize(cloud_ref_schema)
+        oss_props = summarize(
+            oss_ref_schema,
+            FORWARD_COMPATIBLE_OSS_REQUEST_PROPS.get(case.endpoint, frozenset()),
+        )
+        # bodies that only differ in attributes the comparison ignores (titles,
+        # descriptions, forward compatible properties, ...) are compatible too
+        if cloud_props == oss_props and KNOWN_ALIASES.keys().isdisjoint(oss_props[1]):
+            return None
+
+        return cloud_props, oss_props
+
+    table = {}
+    for case in OSS_PATHS:
+        # a single malformed body must only fail the cases that use it
+        try:
+            table[(case.method, case.endpoint)] = compare(case)
+        except Exception as exc:
+            table[(case.method, case.endpoint)] = exc
+    return table
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_schema_file(fpath: str) -> dict[str, Any]:
+    with open(fpath, "rb") as f:
+        return json_loads(f.read())
+
+
+@functools.lru_cache(maxsize=None)
+def load_schema(fpath: str, key: str = None) -> Mapping[str, Any]:
+    """Load a schema file, parsing each file only once per process.
+
+    The returned mapping is a read-only view of the cached document, so it is
+    shared between every fixture and parametrized case that asks for it.
+    """
+    schema = _parse_schema_file(fpath)
     if key:
-        return schema[key]
+        return MappingProxyType(schema[key])
     else:
-        return schema
+        return MappingProxyType(schema)
 
 
 OSS_PATH_IGNORE_REGEXES = {
@@ -43,21 +134,46 @@ OSS_PATH_IGNORE_REGEXES = {
     re.compile(r".*experimental.*"),
 }
 
+# Every endpoint is checked against all of the ignore patterns, so merge them into
+# one alternation that `match`es the same endpoints in a single pass.
+OSS_PATH_IGNORE_PATTERN = re.compile(
+    "|".join(f"(?:{regex.pattern})" for regex in OSS_PATH_IGNORE_REGEXES)
+)
+
+# Some sets of endpoints do not require x-prefect-api-version header in Cloud
+# because they are part of non-orchestration services
+ENDPOINT_GROUPS_WITHOUT_API_VERSION = (
+    "collections",
+    "events",
+    "automations",
+    "templates",
+    "logs/download",
+)
+ENDPOINT_GROUPS_WITHOUT_API_VERSION_PATTERN = re.compile(
+    "|".join(re.escape(group) for group in ENDPOINT_GROUPS_WITHOUT_API_VERSION)
+)
+
+# Routes with these tags are not expected to have a Cloud equivalent.
+SPELLING_EXEMPT_TAGS = frozenset({"Admin", "Flow Run Notification Policies", "Root"})
+
 # OSS has support for some request properties that are not yet in Cloud, but
 # that are forward compatible.
 FORWARD_COMPATIBLE_OSS_REQUEST_PROPS = {
-    "/api/deployments/": ["job_variables"],
-    "/api/deployments/{id}": ["job_variables"],
+    "/api/deployments/": frozenset({"job_variables"}),
+    "/api/deployments/{id}": frozenset({"job_variables"}),
 }
 
 # OSS has support for some properties in its API types that are not yet in
 # Cloud but that are forward compatible.
 FORWARD_COMPATIBLE_OSS_API_TYPE_PROPS = {
-    "DeploymentCreate": ["job_variables"],
-    "DeploymentUpdate": ["job_variables"],
-    "DeploymentResponse": ["job_variables"],
+    "DeploymentCreate": frozenset({"job_variables"}),
+    "DeploymentUpdate": frozenset({"job_variables"}),
+    "DeploymentResponse": frozenset({"job_variables"}),
 }
 
+# Stand-in for endpoints without a JSON request body
+EMPTY_BODY_SCHEMA = MappingProxyType(dict(type=None, properties={}))
+
 # Properties for endpoints that are known to be incompatible between OSS and Cloud
 # so we want to skip them in the comparison.
 # The format is endpoint:method:field:<set of properties to ignore>
@@ -71,206 +187,205 @@ KNOWN_INCOMPATIBLE_API_REQUEST_PROPS = {
 }
 
 
+class OSSCase(NamedTuple):
+    """An OSS operation with everything the path tests need from both schemas"""
+
+    method: str
+    endpoint: str
+    cloud_endpoint: str
+    tags: tuple[str, ...]
+    # parameters keyed by name, see `index_parameters`
+    params: dict[str, tuple]
+    cloud_params: dict[str, tuple]
+    # raw request bodies, resolved by the `body_prop_table` fixture
+    body: Mapping[str, Any]
+    cloud_body: Mapping[str, Any]
+    # raised by the case itself if its parameters could not be indexed
+    error: Exception | None = None
+
+
+def build_oss_case(method, endpoint, operation):
+    cloud_endpoint = convert_oss_endpoint_to_cloud(endpoint)
+    cloud_method = CLOUD_METHOD_SPECS.get((cloud_endpoint, method), {})
+    # easier to use safe gets than handle all possible ways they could differ
+    case = OSSCase(
+        method=method,
+        endpoint=endpoint,
+        cloud_endpoint=cloud_endpoint,
+        tags=tuple(operation.get("tags", ())),
+        params={},
+        cloud_params={},
+        body=operation.get("requestBody", {}),
+        cloud_body=cloud_method.get("requestBody", {}),
+    )
+
+    # The Cloud schema is downloaded live, so an unexpected parameter must fail
+    # only its own case rather than the collection of every test
+    try:
+        return case._replace(
+            params=index_parameters(operation.get("parameters", [])),
+            cloud_params=index_parameters(
+                p
+                for p in cloud_method.get("parameters", [])
+                if p["name"] not in ("account_id", "workspace_id", "token_cost")
+            ),
+        )
+    except Exception as exc:
+        return case._replace(error=exc)
+
+
 def generate_oss_paths_by_method():
-    oss_paths: dict[str, dict[str, dict]] = load_schema("oss_schema.json", key="paths")
-    output = []
-    for endpoint, path in oss_paths.items():
-        if any(regex.match(endpoint) for regex in OSS_PATH_IGNORE_REGEXES):
-            continue
-        for method in path.keys():
-            output.append((method, endpoint, path))
-    return output
+    """Collect every OSS operation along with its precomputed Cloud counterpart,
+    so the parametrized tests don't need to look either side up for every case.
+    """
+    oss_paths: Mapping[str, dict[str, dict]] = load_schema(
+        "oss_schema.json", key="paths"
+    )
+    return [
+        build_oss_case(method, endpoint, operation)
+        for endpoint, path in oss_paths.items()
+        if not OSS_PATH_IGNORE_PATTERN.match(endpoint)
+        for method, operation in path.items()
+    ]
+
+
+def generate_cloud_method_specs():
+    """Index every Cloud operation by `(endpoint, method)`"""
+    cloud_paths = load_schema("cloud_schema.json", key="paths")
+    return {
+        (endpoint, method): spec
+        for endpoint, path in cloud_paths.items()
+        for method, spec in path.items()
+    }
 
 
 def generate_oss_types():
     oss_types = load_schema("oss_schema.json", key="components")["schemas"]
-    output = []
-    for name, typ in oss_types.items():
-        output.append((name, typ))
-    return output
+    cloud_types = load_schema("cloud_schema.json", key="components")["schemas"]
+    # ignore missing for now, as there are name incompatibilities to study.
+    # Marking them up front skips them without setting up their fixtures.
+    return [
+        pytest.param(
+            (name, typ),
+            id=name,
+            marks=()
+            if name in cloud_types
+            else pytest.mark.skip(reason=f"{name} is missing in Cloud"),
+        )
+        for name, typ in oss_types.items()
+    ]
+
+
+# Resolved `$ref`s, keyed by the id of the schema document they point into. The
+# document itself is kept alongside the result so a recycled id can't produce a
+# stale hit. A hit returns the same object as walking the document again, so
+# callers must not mutate what they get back.
+_SCHEMA_REF_CACHE: dict[tuple[int, str], tuple[Mapping[str, Any], Any]] = {}
 
 
 def lookup_schema_ref(schema, ref):
     if not ref:
         return
 
-    keys = ref.split("/")
-    for key in keys:
-        if key == "#":
-            continue
-        schema = schema[key]
-    return schema
+    cache_key = (id(schema), ref)
+    cached = _SCHEMA_REF_CACHE.get(cache_key)
+    if cached is not None and cached[0] is schema:
+        return cached[1]
+
+    resolved = schema
+    # refs are local JSON pointers, e.g. `#/components/schemas/Flow`
+    for key in ref.removeprefix("#/").split("/"):
+        resolved = resolved[key]
+    _SCHEMA_REF_CACHE[cache_key] = (schema, resolved)
+    return resolved
 
 
+@functools.lru_cache(maxsize=None)
 def convert_oss_endpoint_to_cloud(endpoint):
     # Collections endpoint is not nested under accounts and workspaces in Cloud
     if endpoint == "/api/collections/views/{view}":
         return endpoint
-    endpoint = endpoint.replace(
-        "api", "api/accounts/{account_id}/workspaces/{workspace_id}"
-    )
+    # Every other endpoint is scoped to a workspace, so only the leading `/api`
+    # prefix needs rewriting
+    if endpoint.startswith("/api"):
+        return "/api/accounts/{account_id}/workspaces/{workspace_id}" + endpoint[4:]
     return endpoint
 
 
-def lookup_content_body_schema(body: dict[str, Any]) -> dict[str, Any] | None:
-    """Given the schema for an endpoint, find the JSON response's content schema"""
-    schema = body.get("content", {}).get("application/json", {}).get("schema", {})
-
-    # In pydantic v1, the schema reference is a single value
-    if "$ref" in schema:
-        return schema.get("$ref")
-    # In pydantic v2, the schema reference is an `allOf` with a single item
-    elif "allOf" in schema:
-        return schema.get("allOf", [{}])[0].get("$ref")
-
-    return None
-
-
-OSS_PATHS = generate_oss_paths_by_method()
-OSS_TYPES = generate_oss_types()
-
-
-@pytest.mark.parametrize(
-    "oss_path",
-    OSS_PATHS,
-    ids=[f"{method.upper()}: {endpoint}" for (method, endpoint, _) in OSS_PATHS],
-)
-def test_oss_api_spelling_is_cloud_compatible(oss_path, cloud_paths):
-    # error_msg = f"The following API routes were present in OSS but not in Cloud: \n{list_of_routes}"
-    method, endpoint, path = oss_path
-    cloud_endpoint = convert_oss_endpoint_to_cloud(endpoint)
-    if not any(
-        tag in ["Admin", "Flow Run Notification Policies", "Root"]
-        for tag in path[method]["tags"]
-    ):
-        assert cloud_endpoint in cloud_paths, f"{method.upper()}: {cloud_endpoint}"
+# Shared, never mutated, default for the lookups below
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
 
 
-@pytest.mark.parametrize(
-    "oss_path",
-    OSS_PATHS,
-    ids=[f"{method.upper()}: {endpoint}" for (method, endpoint, _) in OSS_PATHS],
-)
-def test_api_path_parameters_are_compatible(oss_path, cloud_paths):
-    method, endpoint, path = oss_path
-    cloud_endpoint = convert_oss_endpoint_to_cloud(endpoint)
-    if cloud_endpoint not in cloud_paths:
-        return  # path existence is checked in another test
+def lookup_content_body_schema(body: dict[str, Any]) -> dict[str, Any] | None:
+    """Given the schema for an endpoint, find the JSON response's content schema"""
+    content = body.get("content", _EMPTY)
+    app = content.get("application/json", _EMPTY)
+    schema = app.get("schema", _EMPTY)
+
+    # In pydantic v1, the schema reference is a single value, in pydantic v2 it
+    # is an `allOf` with a single item
+    return schema.get("$ref") or (schema.get("allOf") or (_EMPTY,))[0].get("$ref")
+
+
+def param_type_and_format(schema):
+    if "anyOf" in schema:
+        # Pydantic v2 renders optional fields with `anyOf` (type, null), but the
+        # Pydantic v1 does not, so let's strip all the additional `null` types out
+        return [
+            (item["type"], item.get("format"))
+            for item in schema["anyOf"]
+            if item.get("type") != "null"
+        ]
+    else:
+        return [(schema.get("type"), schema.get("format"))]
 
-    cloud_params = cloud_paths[cloud_endpoint][method].get("parameters", [])
-    cloud_params = [
-        p
-        for p in cloud_params
-        if p["name"] not in ("account_id", "workspace_id", "token_cost")
-    ]
-    oss_params = path[method].get("parameters", [])
-
-    def param_type_and_format(schema):
-        if "anyOf" in schema:
-            # Pydantic v2 renders optional fields with `anyOf` (type, null), but the
-            # Pydantic v1 does not, so let's strip all the additional `null` types out
-            return [
-                (item["type"], item.get("format"))
-                for item in schema["anyOf"]
-                if item.get("type") != "null"
-            ]
-        else:
-            return [(schema.get("type"), schema.get("format"))]
-
-    # check schemas
-    cloud_params = {
-        p["name"]: (
-            p["in"],
-            p["required"],
-            *param_type_and_format(p["schema"]),
-        )
-        for p in cloud_params
-    }
 
-    oss_params = {
+def index_parameters(params):
+    """Key endpoint parameters by name for comparison"""
+    return {
         p["name"]: (
             p["in"],
             p["required"],
             *param_type_and_format(p["schema"]),
         )
-        for p in oss_params
+        for p in params
     }
 
-    # Some sets of endpoints do not require x-prefect-api-version header in Cloud
-    # because they are part of non-orchestration services
-    ENDPOINT_GROUPS_WITHOUT_API_VERSION = [
-        "collections",
-        "events",
-        "automations",
-        "templates",
-        "logs/download",
-    ]
-
-    if any(group in cloud_endpoint for group in ENDPOINT_GROUPS_WITHOUT_API_VERSION):
-        oss_params.pop("x-prefect-api-version", None)
-
-    assert cloud_params == oss_params
-
 
-@pytest.mark.parametrize(
-    "oss_path",
-    OSS_PATHS,
-    ids=[f"{method.upper()}: {endpoint}" for (method, endpoint, _) in OSS_PATHS],
-)
-def test_api_request_bodies_are_compatible(oss_path, oss_schema, cloud_schema):
-    "Note: this test does not test sorts or filters yet."
-    cloud_paths = cloud_schema["paths"]
+def hashable_default(d):
+    # Some default values are lists or other unhashable types, so convert
+    # them to a string representation for comparison purposes.
+    default = d.get("default")
+    if default == []:
+        return "list"
+    elif default == {}:
+        return "dict"
+    else:
+        return default
 
-    method, endpoint, path = oss_path
-    cloud_endpoint = convert_oss_endpoint_to_cloud(endpoint)
 
-    if cloud_endpoint not in cloud_paths:
-        return  # path existence is checked in another test
+def extract_types(d):
+    if "type" in d:
+        return frozenset({d["type"]})
+    elif "anyOf" in d:
+        return frozenset(item.get("type") for item in d["anyOf"] if item.get("type"))
+    return frozenset()
 
-    # easier to use safe gets than handle all possible ways they could differ
-    cloud_body = cloud_paths[cloud_endpoint][method].get("requestBody", {})
-    oss_body = path[method].get("requestBody", {})
 
-    cloud_body_schema = lookup_content_body_schema(cloud_body)
-    oss_body_schema = lookup_content_body_schema(oss_body)
+def extract_format(d):
+    if "format" in d:
+        return d["format"]
+    # in practice, this will have only one format
+    elif "anyOf" in d:
+        for option in d["anyOf"]:
+            if option.get("format"):
+                return option.get("format")
+    return None
 
-    cloud_ref_schema = lookup_schema_ref(
-        schema=cloud_schema, ref=cloud_body_schema
-    ) or dict(type=None, properties={})
-    oss_ref_schema = lookup_schema_ref(schema=oss_schema, ref=oss_body_schema) or dict(
-        type=None, properties={}
-    )
 
-    def hashable_default(d):
-        # Some default values are lists or other unhashable types, so convert
-        # them to a string representation for comparison purposes.
-        default = d.get("default")
-        if default == []:
-            return "list"
-        elif default == {}:
-            return "dict"
-        else:
-            return default
-
-    def extract_types(d):
-        if "type" in d:
-            return {d["type"]}
-        elif "anyOf" in d:
-            return {item.get("type") for item in d["anyOf"] if item.get("type")}
-        return set()
-
-    def extract_format(d):
-        if "format" in d:
-            return d["format"]
-        # in practice, this will have only one format
-        elif "anyOf" in d:
-            for option in d["anyOf"]:
-                if option.get("format"):
-                    return option.get("format")
-        return None
-
-    # TODO: add sorts and filters
-    prop_gettr = lambda name, d: (
+# TODO: add sorts and filters
+def prop_gettr(name, d):
+    return (
         name,
         extract_types(d),
         extract_format(d),
@@ -278,22 +393,73 @@ def test_api_request_bodies_are_compatible(oss_path, oss_schema, cloud_schema):
         d.get("deprecated"),
     )
 
-    cloud_props = (
-        cloud_ref_schema["type"],
-        {
-            name: prop_gettr(name, d)
-            for name, d in cloud_ref_schema["properties"].items()
-        },
-    )
-    oss_props = (
-        oss_ref_schema["type"],
+
+def body_properties(ref_schema, ignored_props=frozenset()):
+    """Summarize a request body schema as `(type, {name: property attributes})`"""
+    return (
+        ref_schema["type"],
         {
             name: prop_gettr(name, d)
-            for name, d in oss_ref_schema["properties"].items()
-            if name not in FORWARD_COMPATIBLE_OSS_REQUEST_PROPS.get(endpoint, [])
+            for name, d in ref_schema["properties"].items()
+            if name not in ignored_props
         },
     )
 
+
+def oss_path_id(case):
+    return f"{case.method.upper()}: {case.endpoint}"
+
+
+# Detected at import time, rather than as a side effect of a fixture, so that every
+# test sees it regardless of which tests ran first or on which xdist worker.
+PREFECT_V2 = load_schema("oss_schema.json")["info"]["version"].startswith("2")
+
+# OSS request body properties that are checked under a different name in Cloud
+KNOWN_ALIASES = {
+    # cloud aliases this which doesn't appear in the schema
+    "history_interval_seconds": "history_interval",
+}
+if PREFECT_V2:
+    # UI schema validation doesnt really matter for 2.x OSS compat
+    KNOWN_ALIASES["schema"] = "json_schema"
+
+CLOUD_METHOD_SPECS = generate_cloud_method_specs()
+OSS_PATHS = generate_oss_paths_by_method()
+OSS_TYPES = generate_oss_types()
+
+
+def check_endpoint_spelling(oss_path, cloud_paths):
+    # error_msg = f"The following API routes were present in OSS but not in Cloud: \n{list_of_routes}"
+    method, cloud_endpoint = oss_path.method, oss_path.cloud_endpoint
+    if SPELLING_EXEMPT_TAGS.isdisjoint(oss_path.tags):
+        assert cloud_endpoint in cloud_paths, f"{method.upper()}: {cloud_endpoint}"
+
+
+def check_path_parameters(oss_path):
+    oss_params = oss_path.params
+
+    if ENDPOINT_GROUPS_WITHOUT_API_VERSION_PATTERN.search(oss_path.cloud_endpoint):
+        # copy rather than pop, as the parameters are shared by the whole session
+        oss_params = {
+            name: param
+            for name, param in oss_params.items()
+            if name != "x-prefect-api-version"
+        }
+
+    assert oss_path.cloud_params == oss_params
+
+
+def check_request_body(oss_path, body_prop_table):
+    "Note: this does not check sorts or filters yet."
+    method, endpoint = oss_path.method, oss_path.endpoint
+
+    row = body_prop_table[(method, endpoint)]
+    if isinstance(row, Exception):
+        raise row
+    if row is None:
+        return  # equivalent request bodies are trivially compatible
+    cloud_props, oss_props = row
+
     # have to do some delicate handling here - request bodies are compatible so long as:
     # - OSS fields are always present in Cloud
     # - new Cloud fields aren't required (this is difficult to check right now as it's method dependent!)
@@ -308,23 +474,19 @@ def test_api_request_bodies_are_compatible(oss_path, oss_schema, cloud_schema):
         oss_default,
         oss_deprecated,
     ) in oss_props[1].values():
-        # Note, this print is here intentionally to make it easier to understand test
-        # failures when looping over fields
-        print("parameter name:", oss_name)
+        oss_name = KNOWN_ALIASES.get(oss_name, oss_name)
 
-        if oss_name == "history_interval_seconds":
-            oss_name = "history_interval"  # cloud aliases this which doesn't appear in the schema
-        elif oss_name == "schema" and PREFECT_V2:
-            oss_name = "json_schema"  # UI schema validation doesnt really matter for 2.x OSS compat
-
-        assert oss_name in cloud_props[1]
+        # Note, the assertion messages name the field to make it easier to understand
+        # test failures when looping over fields. They are only formatted on failure.
+        cloud_prop = cloud_props[1].get(oss_name)
+        assert cloud_prop is not None, f"parameter name: {oss_name}"
         (
             cloud_name,
             cloud_types,
             cloud_format,
             cloud_default,
             cloud_deprecated,
-        ) = cloud_props[1][oss_name]
+        ) = cloud_prop
 
         # In Pydantic v2, if a field is not required, it's format is not included, so
         # we need to remove it from the comparison
@@ -334,7 +496,7 @@ def test_api_request_bodies_are_compatible(oss_path, oss_schema, cloud_schema):
         # While OSS and Cloud are on different versions of pydantic, there is a
         # discrepancy where any option OSS type (correctly) includes `anyOf` `null`
         # while Cloud does not.
-        oss_types.discard("null")
+        oss_types = oss_types - {"null"}
 
         known_incompatible_props = (
             KNOWN_INCOMPATIBLE_API_REQUEST_PROPS.get(endpoint, {})
@@ -343,49 +505,88 @@ def test_api_request_bodies_are_compatible(oss_path, oss_schema, cloud_schema):
         )
 
         if "name" not in known_incompatible_props:
-            assert oss_name == cloud_name
+            assert oss_name == cloud_name, f"parameter name: {oss_name}"
 
         if "types" not in known_incompatible_props:
-            assert oss_types <= cloud_types
+            assert oss_types <= cloud_types, f"parameter name: {oss_name}"
 
         if "format" not in known_incompatible_props:
-            assert oss_format == cloud_format
+            assert oss_format == cloud_format, f"parameter name: {oss_name}"
 
         if "default" not in known_incompatible_props:
-            assert oss_default == cloud_default
+            assert oss_default == cloud_default, f"parameter name: {oss_name}"
 
         if "deprecated" not in known_incompatible_props:
-            assert oss_deprecated == cloud_deprecated
+            assert oss_deprecated == cloud_deprecated, f"parameter name: {oss_name}"
 
 
 @pytest.mark.parametrize(
-    "oss_name_and_type", OSS_TYPES, ids=[name for (name, _) in OSS_TYPES]
+    "oss_path",
+    OSS_PATHS,
+    ids=oss_path_id,
 )
-def test_oss_api_types_are_cloud_compatible(oss_name_and_type, cloud_schema):
-    cloud_types = cloud_schema["components"]["schemas"]
+def test_oss_path_is_cloud_compatible(oss_path, cloud_paths, request):
+    # every check runs in the same case so each path is set up and reported once
+    check_endpoint_spelling(oss_path, cloud_paths)
+
+    method, cloud_endpoint = oss_path.method, oss_path.cloud_endpoint
+    if cloud_endpoint not in cloud_paths:
+        return  # only exempt routes can get this far without a Cloud endpoint
+    assert (cloud_endpoint, method) in CLOUD_METHOD_SPECS, (
+        f"{method.upper()}: {cloud_endpoint}"
+    )
+
+    if oss_path.error is not None:
+        raise oss_path.error
+    check_path_parameters(oss_path)
+    # only set up the request bodies once the route checks have passed, so a
+    # problem with them can't hide the results above
+    check_request_body(oss_path, request.getfixturevalue("body_prop_table"))
+
+
+@pytest.mark.parametrize("oss_name_and_type", OSS_TYPES)
+def test_oss_api_types_are_cloud_compatible(oss_name_and_type, cloud_components):
     name, oss_type = oss_name_and_type
 
-    # ignore missing for now, as there are name incompatibilities to study
-    try:
-        cloud_type = cloud_types[name]
-    except KeyError:
+    cloud_type = cloud_components[name]
+
+    # Identical definitions are trivially compatible, so skip the per-field
+    # comparison (and the Cloud preprocessing) entirely
+    if oss_type == cloud_type:
         return
 
     # preprocess pydantic v1 schema to match pydantic v2 schema
     def preprocess_pydantic_v1_type(schema):
-        # transform any non-required fields to by anyOf (null, type)
-        for field_name, props in schema.get("properties", {}).items():
-            required_fields = schema.get("required", [])
-            if field_name not in required_fields:
-                current_definition = schema["properties"][field_name]
-                if "anyOf" in current_definition:
-                    schema["properties"][field_name]["anyOf"].append({"type": "null"})
-                else:
-                    schema["properties"][field_name] = {
-                        "anyOf": [{"type": "null"}, props]
-                    }
-                required_fields.append(field_name)
-        return schema
+        properties = schema.get("properties", {})
+        required_fields = schema.get("required", [])
+        # nothing to transform when every field is already required
+        if properties.keys() <= set(required_fields):
+            return schema
+
+        # transform any non-required fields to by anyOf (null, type). The Cloud
+        # schema is shared by the whole session, so build a new one rather than
+        # editing it in place.
+        new_properties = {}
+        new_required_fields = list(required_fields)
+        for field_name, props in properties.items():
+            if field_name in required_fields:
+                new_properties[field_name] = props
+                continue
+
+            if "anyOf" in props:
+                new_properties[field_name] = {
+                    **props,
+                    "anyOf": [*props["anyOf"], {"type": "null"}],
+                }
+            else:
+                new_properties[field_name] = {"anyOf": [{"type": "null"}, props]}
+            new_required_fields.append(field_name)
+
+        new_schema = {**schema, "properties": new_properties}
+        # a type without a `required` list still has none afterwards
+        if "required" in schema:
+            new_schema["required"] = new_required_fields
+        return new_schema
 
     cloud_type = preprocess_pydantic_v1_type(cloud_type)
 
@@ -404,26 +605,21 @@ def test_oss_api_types_are_cloud_compatible(oss_name_and_type, cloud_schema):
 
             return
 
-        items = [
-            (k, v)
-            for k, v in oss_props.items()
-            if k not in FORWARD_COMPATIBLE_OSS_API_TYPE_PROPS.get(name, [])
-        ]
+        skipped_fields = FORWARD_COMPATIBLE_OSS_API_TYPE_PROPS.get(name, frozenset())
+        # fields are ignored in all cases
+        if PREFECT_V2 and name == "StateCreate":
+            skipped_fields |= {"timestamp", "id"}
 
-        for field_name, props in items:
-            # Note, this print is here intentionally to make it easier to understand
-            # test failures when looping over fields
-            print("field name:", field_name)
-
-            # fields are ignored in all cases
-            if (
-                PREFECT_V2
-                and name == "StateCreate"
-                and field_name in ["timestamp", "id"]
-            ):
-                continue
+        # check every OSS field is present in Cloud at once, so the per-field loop
+        # below only has to compare types. A key missing from OSS defaults to an
+        # empty dict, while Cloud may still have it as a list or string.
+        cloud_fields = cloud_props.keys() if isinstance(cloud_props, dict) else ()
+        missing_fields = oss_props.keys() - cloud_fields - skipped_fields
+        assert not missing_fields, f"missing in Cloud: {sorted(missing_fields)}"
 
-            assert field_name in cloud_props
+        for field_name, props in oss_props.items():
+            if field_name in skipped_fields:
+                continue
 
             oss_options = set()
             cloud_options = set()
@@ -438,12 +634,13 @@ def test_oss_api_types_are_cloud_compatible(oss_name_and_type, cloud_schema):
                     opt.get("type") for opt in props.get("anyOf") if opt.get("type")
                 }
 
-            if cloud_props[field_name].get("type"):
-                cloud_options = {cloud_props[field_name].get("type")}
-            elif cloud_props[field_name].get("anyOf"):
+            cloud_field = cloud_props[field_name]
+            if cloud_field.get("type"):
+                cloud_options = {cloud_field.get("type")}
+            elif cloud_field.get("anyOf"):
                 cloud_options = {
                     opt.get("type")
-                    for opt in cloud_props[field_name].get("anyOf")
+                    for opt in cloud_field.get("anyOf")
                     if opt.get("type")
                 }
 
@@ -452,4 +649,6 @@ def test_oss_api_types_are_cloud_compatible(oss_name_and_type, cloud_schema):
             # while Cloud does not.
             oss_options.discard("null")
 
-            assert oss_options <= cloud_options
+            # Note, the message names the field to make it easier to understand test
+            # failures when looping over fields
+            assert oss_options <= cloud_options, f"field name: {field_name}"